@@ -8,83 +8,635 @@ Improvements:
 - Implemented comprehensive logging
 - Enhanced error handling and model switching
 - Added model detection and management
+- Added exact-match response caching
+- Added semantic caching for paraphrased topics
+- Added async API for concurrent brainstorming
+- Added streaming responses
 """
 
+import asyncio
+import bisect
+import hashlib
+import itertools
+import json
 import logging
 import os
+import string
+import threading
+import time
+import httpx
+import numpy as np
+import orjson
 import requests
-from openai import OpenAI
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from openai import (
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+)
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Sequence, Tuple
 from pathlib import Path
+from logging_setup import configure_logging
+
+try:
+    import faiss
+except ImportError:
+    faiss = None  # Semantic cache falls back to a numpy scan
 
 # Set up logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-logging.basicConfig(
-    filename=log_dir / "app.log",
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filemode='a'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Response cache settings
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL = None  # Seconds before a cached response expires (None = never)
+
+# Semantic cache settings
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity for a hit
+SEMANTIC_FAISS_MIN_ENTRIES = 1024  # Move a scope into a FAISS index at this size
+SEMANTIC_CACHE_MAX_ENTRIES = 4096  # Per scope; the oldest entries are evicted first
+SEMANTIC_INITIAL_CAPACITY = 64  # Rows preallocated per scope, doubled as it fills
+SEMANTIC_CACHE_MANIFEST = "semantic_cache.json"
+
+# Maximum number of in-flight async requests
+ASYNC_MAX_CONCURRENCY = 8
+
+# Request timeouts in seconds as (connect, read)
+HTTP_TIMEOUT = (1.0, 60.0)
+MODELS_TIMEOUT = (0.5, 2.0)
+HTTPX_TIMEOUT = httpx.Timeout(HTTP_TIMEOUT[1], connect=HTTP_TIMEOUT[0])
+TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException, APITimeoutError)
+
+# Headers for pre-serialized JSON request bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Ollama endpoint used when OLLAMA_ENDPOINTS is not set
+DEFAULT_OLLAMA_ENDPOINT = "http://localhost:11434"
+
+# Seconds to wait for the Ollama startup probe
+PROBE_TIMEOUT = 1.0
+
+# Models offered for OpenAI
+_OPENAI_MODELS = ("gpt-4", "gpt-3.5-turbo", "gpt-4-turbo")
+
+# Seconds to reuse the available model listing
+MODELS_CACHE_TTL = 30
+
+# Prompt templates, compiled once at import
+_BRAINSTORM_TPL = string.Template("""
+        Help me brainstorm an AI/Data Science project related to $topic. Please provide:
+        1. Project title
+        2. Problem statement
+        3. Suggested approach
+        4. Required technologies/libraries
+        5. Potential challenges
+        6. Expected outcomes
+        """)
+
+_CODE_TPL = string.Template("""
+        Please provide Python code suggestions for the following functionality:
+        $description
+        
+        Include:
+        1. Code implementation
+        2. Required imports
+        3. Brief explanation of the approach
+        4. Any potential improvements
+        """)
+
+def _is_read_timeout(error: Exception) -> bool:
+    """Whether error is a read timeout that requests re-raised as ConnectionError while streaming."""
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    causes = (*error.args, error.__cause__, error.__context__)
+    return any(isinstance(cause, ReadTimeoutError) for cause in causes)
+
+class _SemanticScope:
+    """Embeddings and responses for one (provider, model, kind) semantic cache scope, oldest first."""
+    
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.size = 0
+        # Preallocated numpy rows, replaced by a FAISS index once the scope grows large enough
+        self.vectors = np.empty((SEMANTIC_INITIAL_CAPACITY, dim), dtype="float32")
+        self.index = None
+        self.responses: List[Dict[str, Any]] = []
+        self.created: List[float] = []
+    
+    def expire(self, now: float) -> None:
+        """Drop entries older than CACHE_TTL; entries are kept in creation order."""
+        if CACHE_TTL is not None:
+            expired = bisect.bisect_left(self.created, now - CACHE_TTL)
+            if expired:
+                self._evict_oldest(expired)
+    
+    def search(self, embedding) -> Optional[Tuple[float, int]]:
+        """Return (similarity, position) of the closest entry, or None if empty."""
+        if self.size == 0:
+            return None
+        if self.index is None:
+            sims = self.vectors[:self.size] @ embedding
+            best = int(sims.argmax())
+            return float(sims[best]), best
+        scores, ids = self.index.search(embedding.reshape(1, -1), 1)
+        return float(scores[0, 0]), int(ids[0, 0])
+    
+    def add(self, embedding, result: Dict[str, Any], created: float) -> None:
+        """Append an entry, evicting the oldest tenth of the scope when it is full."""
+        if self.size >= SEMANTIC_CACHE_MAX_ENTRIES:
+            self._evict_oldest(max(1, SEMANTIC_CACHE_MAX_ENTRIES // 10))
+        
+        if self.index is not None:
+            self.index.add(embedding.reshape(1, -1))
+        else:
+            if self.size == len(self.vectors):
+                grown = np.empty((min(2 * len(self.vectors), SEMANTIC_CACHE_MAX_ENTRIES), self.dim), dtype="float32")
+                grown[:self.size] = self.vectors[:self.size]
+                self.vectors = grown
+            self.vectors[self.size] = embedding
+        self.size += 1
+        self.responses.append(result)
+        self.created.append(created)
+        
+        # Inner product on normalized vectors is cosine similarity
+        if faiss is not None and self.index is None and self.size >= SEMANTIC_FAISS_MIN_ENTRIES:
+            self.index = faiss.IndexFlatIP(self.dim)
+            self.index.add(self.vectors[:self.size])
+            self.vectors = None
+            logger.info("Moved a semantic cache scope to a FAISS index")
+    
+    def embeddings(self):
+        """Return the stored embeddings as an (N, dim) array."""
+        if self.index is None:
+            return self.vectors[:self.size]
+        return self.index.reconstruct_n(0, self.size)
+    
+    def _evict_oldest(self, count: int) -> None:
+        """Remove the first count entries."""
+        count = min(count, self.size)
+        if self.index is not None:
+            self.index.remove_ids(np.arange(count, dtype="int64"))
+        else:
+            self.vectors[:self.size - count] = self.vectors[count:self.size]
+        self.size -= count
+        del self.responses[:count]
+        del self.created[:count]
+
 class AIProjectAssistant:
     """Wrapper class for AI model interactions (OpenAI and Ollama) focused on Data Science and AI projects."""
     
     def __init__(self):
         """Initialize the AI assistant."""
         self.openai_client = None
-        self.ollama_endpoint = "http://localhost:11434"
+        # Comma-separated OLLAMA_ENDPOINTS are load-balanced round-robin
+        self.ollama_endpoints = [
+            endpoint.strip().rstrip("/")
+            for endpoint in os.getenv("OLLAMA_ENDPOINTS", DEFAULT_OLLAMA_ENDPOINT).split(",")
+            if endpoint.strip()
+        ] or [DEFAULT_OLLAMA_ENDPOINT]
+        self.ollama_endpoint = self.ollama_endpoints[0]  # Used for model listing
         self.current_provider = None
         self.default_temperature = 0.7
         
-        # Try to initialize OpenAI from environment
+        # Shared keep-alive HTTP session for Ollama generate requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        
+        # Probes and model listing get no retries, so their timeouts bound the total wait
+        self._probe_session = requests.Session()
+        probe_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self._probe_session.mount("http://", probe_adapter)
+        self._probe_session.mount("https://", probe_adapter)
+        self._probe_session.headers["Connection"] = "keep-alive"
+        
+        # Cached (timestamp, models) from the last get_available_models call
+        self._models_cache: Optional[Tuple[float, Mapping[str, Sequence[str]]]] = None
+        
+        # Exact-match LRU cache of successful responses, keyed by request hash
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Semantic cache: embeddings and responses per (provider, model, kind)
+        self._embedder = None
+        self._embedder_failed = False
+        self._emb_scopes: Dict[Tuple[str, str, str], _SemanticScope] = {}
+        self._emb_lock = threading.Lock()
+        
+        # Async clients, created lazily for the running event loop
+        self._async_loop = None
+        self._async_openai = None
+        self._httpx = None
+        self._async_semaphore = None
+        
+        # Initialize OpenAI and probe Ollama concurrently
         api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            try:
-                self.openai_client = OpenAI(api_key=api_key)
-                self.current_provider = "openai"
-                self.default_model = "gpt-4"
-                logger.info("OpenAI client initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
-        
-        # Check for Ollama availability
+        self._openai_api_key = api_key
+        with ThreadPoolExecutor(max_workers=1 + len(self.ollama_endpoints)) as executor:
+            openai_future = executor.submit(self._init_openai, api_key)
+            ollama_versions = list(executor.map(self._probe_ollama, self.ollama_endpoints))
+            self.openai_client = openai_future.result()
+        
+        # Rotate only over endpoints that answered, unless none did
+        healthy = [
+            endpoint for endpoint, version in zip(self.ollama_endpoints, ollama_versions)
+            if version is not None
+        ]
+        if healthy:
+            self.ollama_endpoint = healthy[0]
+        self._rr = itertools.cycle(healthy or self.ollama_endpoints)
+        self._rr_lock = threading.Lock()
+        
+        if self.openai_client:
+            self.current_provider = "openai"
+            self.default_model = "gpt-4"
+        # Version is only probed here; afterwards /api/tags alone tracks availability
+        self._ollama_ok = bool(healthy)
+        if healthy:
+            self.current_provider = self.current_provider or "ollama"
+            self.default_model = "llama3.2:latest"  # Include :latest suffix for Ollama
+            # Prime the model listing over the connection the probe left open
+            self.get_available_models()
+        
+    def _init_openai(self, api_key: Optional[str]) -> Optional[OpenAI]:
+        """Create the OpenAI client from an API key, or return None."""
+        if not api_key:
+            return None
+        try:
+            # HTTP/2 multiplexes concurrent requests over one connection
+            client = OpenAI(
+                api_key=api_key,
+                http_client=DefaultHttpxClient(http2=True),
+                timeout=HTTPX_TIMEOUT
+            )
+            logger.info("OpenAI client initialized successfully")
+            return client
+        except Exception as e:
+            logger.error("Failed to initialize OpenAI client: %s", e)
+            return None
+
+    def _probe_ollama(self, endpoint: str) -> Optional[str]:
+        """Check an Ollama endpoint for availability and return its version, or None."""
         try:
-            response = requests.get(f"{self.ollama_endpoint}/api/version")
+            response = self._probe_session.get(f"{endpoint}/api/version", timeout=PROBE_TIMEOUT)
             if response.status_code == 200:
-                self.current_provider = self.current_provider or "ollama"
-                self.default_model = "llama3.2:latest"  # Include :latest suffix for Ollama
-                logger.info(f"Ollama detected: {response.json().get('version')}")
+                version = orjson.loads(response.content).get('version', 'unknown')
+                logger.info("Ollama detected at %s: %s", endpoint, version)
+                return version
         except Exception as e:
-            logger.error(f"Failed to detect Ollama: {e}")
+            logger.error("Failed to detect Ollama at %s: %s", endpoint, e)
+        return None
+
+    def _next_ollama_endpoint(self) -> str:
+        """Pick the next Ollama endpoint in round-robin order."""
+        with self._rr_lock:
+            return next(self._rr)
+
+    def get_available_models(self) -> Mapping[str, Sequence[str]]:
+        """
+        Get available models from both providers, reusing recent results.
         
-    def get_available_models(self) -> Dict[str, list]:
-        """Get available models from both providers."""
-        models = {"openai": [], "ollama": []}
+        Returns:
+            Mapping[str, Sequence[str]]: Model names per provider as tuples; the
+                result is shared between callers and must not be modified
+        """
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < MODELS_CACHE_TTL:
+            return cached[1]
+        
+        models = {"openai": (), "ollama": ()}
         
         # Get OpenAI models
         if self.openai_client:
-            models["openai"] = ["gpt-4", "gpt-3.5-turbo", "gpt-4-turbo"]
+            models["openai"] = _OPENAI_MODELS
             logger.debug("Retrieved OpenAI models")
         
         # Get Ollama models
         try:
-            response = requests.get(f"{self.ollama_endpoint}/api/tags")
+            response = self._probe_session.get(f"{self.ollama_endpoint}/api/tags", timeout=MODELS_TIMEOUT)
             if response.status_code == 200:
                 # Strip ":latest" suffix from model names for cleaner display
-                models["ollama"] = [model["name"].split(":")[0] for model in response.json().get("models", [])]
-                logger.debug(f"Retrieved Ollama models: {models['ollama']}")
+                data = orjson.loads(response.content)
+                models["ollama"] = tuple(model["name"].partition(":")[0] for model in data.get("models", ()))
+                self._ollama_ok = True
+                logger.debug("Retrieved %d Ollama models", len(models["ollama"]))
         except Exception as e:
-            logger.error(f"Failed to get Ollama models: {e}")
+            self._ollama_ok = False
+            logger.error("Failed to get Ollama models: %s", e)
         
+        models = MappingProxyType(models)
+        self._models_cache = (time.monotonic(), models)
         return models
 
+    @property
+    def ollama_available(self) -> bool:
+        """Whether Ollama answered the startup probe or the latest model listing."""
+        return self._ollama_ok
+
+    def invalidate_models_cache(self) -> None:
+        """Force the next get_available_models call to query the providers again."""
+        self._models_cache = None
+
+    @staticmethod
+    def _cache_key(provider: str, model: str, temperature: float, prompt: str) -> str:
+        """Build a stable cache key for a request."""
+        payload = json.dumps(
+            {"p": provider, "m": model, "t": temperature, "prompt": prompt},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached response, or None on a miss."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            created, result = entry
+            if CACHE_TTL is not None and time.time() - created > CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        cached = dict(result)
+        cached["tokens_used"] = "cached"
+        return cached
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a successful response, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[key] = (time.time(), dict(result))
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def save_cache(self, path: Path) -> None:
+        """
+        Write the exact-match response cache to a JSON file.
+        
+        Args:
+            path (Path): Destination file
+        """
+        with self._cache_lock:
+            entries = {key: [created, result] for key, (created, result) in self._cache.items()}
+        # Write a temp file and swap it in, so readers never see a partial file
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+        logger.info("Saved %d cached responses to %s", len(entries), path)
+
+    def load_cache(self, path: Path) -> None:
+        """
+        Merge responses from a file written by save_cache into the cache.
+        
+        Args:
+            path (Path): Source file
+        """
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        if not isinstance(entries, dict):
+            raise ValueError(f"Expected a JSON object in {path}")
+        
+        # Keep only well-formed {key: [timestamp, response dict]} entries
+        valid = {}
+        for key, entry in entries.items():
+            if (isinstance(entry, list) and len(entry) == 2
+                    and isinstance(entry[0], (int, float)) and not isinstance(entry[0], bool)
+                    and isinstance(entry[1], dict)):
+                valid[key] = (float(entry[0]), entry[1])
+        if len(valid) < len(entries):
+            logger.warning("Skipped %d malformed cache entries in %s", len(entries) - len(valid), path)
+        
+        with self._cache_lock:
+            self._cache.update(valid)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        logger.info("Loaded %d cached responses from %s", len(valid), path)
+
+    def _get_embedder(self):
+        """Load the sentence embedding model on first use."""
+        if self._embedder is None and not self._embedder_failed:
+            with self._emb_lock:
+                if self._embedder is None and not self._embedder_failed:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+                        logger.info("Loaded embedding model %s", EMBEDDING_MODEL)
+                    except Exception as e:
+                        self._embedder_failed = True
+                        logger.error("Semantic cache disabled, failed to load embedding model: %s", e)
+        return self._embedder
+
+    def _embed(self, text: str):
+        """Return an L2-normalized float32 embedding, or None if unavailable."""
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        return embedder.encode(text, normalize_embeddings=True).astype("float32")
+
+    def _semantic_get(self, scope: Tuple[str, str, str], embedding) -> Optional[Dict[str, Any]]:
+        """Return a copy of the closest cached response above the similarity threshold."""
+        with self._emb_lock:
+            entries = self._emb_scopes.get(scope)
+            if entries is None or entries.dim != embedding.shape[0]:
+                return None
+            entries.expire(time.time())
+            match = entries.search(embedding)
+            if match is None or match[0] < SEMANTIC_CACHE_THRESHOLD:
+                return None
+            result = entries.responses[match[1]]
+        cached = dict(result)
+        cached["tokens_used"] = "cached"
+        return cached
+
+    def _semantic_put(self, scope: Tuple[str, str, str], embedding, result: Dict[str, Any]) -> None:
+        """Add a successful response to the semantic cache."""
+        now = time.time()
+        with self._emb_lock:
+            entries = self._emb_scopes.get(scope)
+            if entries is None:
+                entries = self._emb_scopes[scope] = _SemanticScope(embedding.shape[0])
+            entries.expire(now)
+            entries.add(embedding, dict(result), now)
+
+    def save_semantic_cache(self, directory: Path) -> None:
+        """
+        Write the semantic cache indexes and responses to a directory.
+        
+        Args:
+            directory (Path): Destination directory, created if missing
+        """
+        with self._emb_lock:
+            if not self._emb_scopes:
+                return
+            directory.mkdir(parents=True, exist_ok=True)
+            scopes = []
+            for i, (scope, entries) in enumerate(self._emb_scopes.items()):
+                if entries.index is None:
+                    filename = f"semantic_{i}.npy"
+                    tmp_path = directory / (filename + ".tmp")
+                    with open(tmp_path, "wb") as f:
+                        np.save(f, entries.embeddings())
+                else:
+                    filename = f"semantic_{i}.faiss"
+                    tmp_path = directory / (filename + ".tmp")
+                    faiss.write_index(entries.index, str(tmp_path))
+                os.replace(tmp_path, directory / filename)
+                scopes.append({
+                    "scope": list(scope),
+                    "index": filename,
+                    "dim": entries.dim,
+                    "responses": list(entries.responses),
+                    "created": list(entries.created)
+                })
+        # Embeddings are only comparable when produced by the same model
+        manifest = {"embedding_model": EMBEDDING_MODEL, "scopes": scopes}
+        # Each file is written to a temp file and swapped in, the manifest last
+        manifest_path = directory / SEMANTIC_CACHE_MANIFEST
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+        logger.info("Saved semantic cache for %d scopes to %s", len(scopes), directory)
+
+    def load_semantic_cache(self, directory: Path) -> None:
+        """
+        Load a semantic cache written by save_semantic_cache, if present.
+        
+        Args:
+            directory (Path): Source directory
+        """
+        manifest_path = directory / SEMANTIC_CACHE_MANIFEST
+        if not manifest_path.exists():
+            return
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        
+        if not isinstance(manifest, dict) or manifest.get("embedding_model") != EMBEDDING_MODEL:
+            logger.warning("Skipping semantic cache in %s, it was not built with %s", directory, EMBEDDING_MODEL)
+            return
+        
+        loaded = 0
+        now = time.time()
+        with self._emb_lock:
+            for entry in manifest["scopes"]:
+                filename = entry["index"]
+                try:
+                    if filename.endswith(".npy"):
+                        vectors = np.load(directory / filename)
+                    elif faiss is not None:
+                        index = faiss.read_index(str(directory / filename))
+                        vectors = index.reconstruct_n(0, index.ntotal)
+                    else:
+                        logger.warning("Skipping semantic cache %s, faiss is not installed", filename)
+                        continue
+                except (OSError, ValueError, RuntimeError) as e:
+                    # Missing or unreadable index file; faiss raises RuntimeError
+                    logger.error("Skipping unreadable semantic cache %s: %s", filename, e)
+                    continue
+                
+                scope = tuple(entry["scope"])
+                existing = self._emb_scopes.get(scope)
+                if vectors.ndim != 2 or vectors.shape[1] != entry["dim"] or (
+                        existing is not None and existing.dim != entry["dim"]):
+                    logger.warning("Skipping semantic cache %s, embedding dimension does not match", filename)
+                    continue
+                if not len(vectors) == len(entry["responses"]) == len(entry["created"]):
+                    # Rows out of step would pair embeddings with the wrong responses
+                    logger.warning("Skipping semantic cache %s, row counts do not match the manifest", filename)
+                    continue
+                
+                # Merge with entries added since startup (e.g. by warm_cache), oldest first
+                rows = list(zip(entry["created"], vectors, entry["responses"]))
+                if existing is not None:
+                    rows.extend(zip(existing.created, existing.embeddings(), existing.responses))
+                rows.sort(key=lambda row: row[0])
+                entries = _SemanticScope(entry["dim"])
+                for created, vector, result in rows:
+                    entries.add(vector, result, created)
+                entries.expire(now)
+                self._emb_scopes[scope] = entries
+                loaded += 1
+        logger.info("Loaded semantic cache for %d scopes from %s", loaded, directory)
+
+    def _resolve_request(self,
+                         provider: Optional[str],
+                         model: Optional[str],
+                         temperature: Optional[float]) -> Tuple[str, str, float]:
+        """Fill in default provider, model and temperature for a request."""
+        provider = provider or self.current_provider
+        temp = temperature or self.default_temperature
+        
+        # Handle model selection based on provider
+        if provider == "openai":
+            model = model or "gpt-4"  # Default OpenAI model
+        else:  # ollama
+            if model and not ":" in model:
+                model = f"{model}:latest"  # Add :latest suffix if not present
+            else:
+                model = self.default_model  # Use default Ollama model
+        
+        return provider, model, temp
+
+    def _lookup_cache(self,
+                      prompt: str,
+                      provider: str,
+                      model: str,
+                      temp: float,
+                      semantic_key: Optional[Tuple[str, str]]):
+        """
+        Check the exact-match and semantic caches for a request.
+        
+        Returns:
+            Tuple of (cache key, cached response or None, semantic (scope, embedding) or None)
+        """
+        cache_key = self._cache_key(provider, model, temp, prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("Cache hit for %s with model %s", provider, model)
+            return cache_key, cached, None
+        
+        semantic = None
+        if semantic_key is not None:
+            kind, text = semantic_key
+            scope = (provider, model, kind)
+            embedding = self._embed(text)
+            if embedding is not None:
+                cached = self._semantic_get(scope, embedding)
+                if cached is not None:
+                    logger.info("Semantic cache hit for %s with model %s", provider, model)
+                    self._cache_put(cache_key, cached)
+                    return cache_key, cached, None
+                semantic = (scope, embedding)
+        
+        return cache_key, None, semantic
+
+    def _store_cache(self, cache_key: str, semantic, result: Dict[str, Any]) -> None:
+        """Store a successful response in the exact-match and semantic caches."""
+        self._cache_put(cache_key, result)
+        if semantic is not None:
+            self._semantic_put(*semantic, result)
+
     def send_prompt(self, 
                    prompt: str, 
                    provider: Optional[str] = None,
                    model: Optional[str] = None,
-                   temperature: Optional[float] = None) -> Dict[str, Any]:
+                   temperature: Optional[float] = None,
+                   semantic_key: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
         """
         Send a prompt to the selected AI provider and get the response.
         
@@ -93,23 +645,18 @@ class AIProjectAssistant:
             provider (str, optional): AI provider to use ('openai' or 'ollama')
             model (str, optional): Model to use
             temperature (float, optional): Response creativity (0-1)
+            semantic_key (tuple, optional): (kind, text) pair enabling the semantic
+                cache; responses are reused for similar text of the same kind
             
         Returns:
             Dict[str, Any]: AI response
         """
-        provider = provider or self.current_provider
-        temp = temperature or self.default_temperature
-        
-        # Handle model selection based on provider
-        if provider == "openai":
-            model = model or "gpt-4"  # Default OpenAI model
-        else:  # ollama
-            if model and not ":" in model:
-                model = f"{model}:latest"  # Add :latest suffix if not present
-            else:
-                model = self.default_model  # Use default Ollama model
+        provider, model, temp = self._resolve_request(provider, model, temperature)
+        cache_key, cached, semantic = self._lookup_cache(prompt, provider, model, temp, semantic_key)
+        if cached is not None:
+            return cached
         
-        logger.info(f"Sending prompt using {provider} with model {model}")
+        logger.info("Sending prompt using %s with model %s", provider, model)
         
         try:
             if provider == "openai" and self.openai_client:
@@ -118,42 +665,302 @@ class AIProjectAssistant:
                     messages=[{"role": "user", "content": prompt}],
                     temperature=temp
                 )
-                logger.debug(f"OpenAI API response received for model {model}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("OpenAI API response received for model %s", model)
                 result = {
                     "success": True,
                     "content": response.choices[0].message.content,
                     "tokens_used": response.usage.total_tokens
                 }
             elif provider == "ollama":
-                logger.debug(f"Sending request to Ollama with model {model}")
-                response = requests.post(
-                    f"{self.ollama_endpoint}/api/generate",
-                    json={
+                logger.debug("Sending request to Ollama with model %s", model)
+                response = self._session.post(
+                    f"{self._next_ollama_endpoint()}/api/generate",
+                    data=orjson.dumps({
                         "model": model,  # Ollama model name with :latest suffix
                         "prompt": prompt,
-                        "temperature": temp
-                    }
+                        "temperature": temp,
+                        "stream": False
+                    }),
+                    headers=_JSON_HEADERS,
+                    timeout=HTTP_TIMEOUT
                 )
-                logger.debug(f"Ollama API response received for model {model}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Ollama API response received for model %s", model)
                 response.raise_for_status()
                 result = {
                     "success": True,
-                    "content": response.json().get("response", ""),
+                    "content": orjson.loads(response.content).get("response", ""),
                     "tokens_used": "N/A"  # Ollama doesn't provide token count
                 }
             else:
                 raise ValueError(f"Invalid or unavailable provider: {provider}")
             
-            logger.debug(f"Successfully got response from {provider}")
+            logger.debug("Successfully got response from %s", provider)
+            self._store_cache(cache_key, semantic, result)
             return result
             
+        except TIMEOUT_ERRORS as e:
+            logger.error("Timed out sending prompt to %s: %s", provider, e)
+            return {
+                "success": False,
+                "error": "timeout"
+            }
         except Exception as e:
-            logger.error(f"Error sending prompt to {provider}: {e}")
+            logger.error("Error sending prompt to %s: %s", provider, e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def send_prompt_stream(self, 
+                          prompt: str, 
+                          provider: Optional[str] = None,
+                          model: Optional[str] = None,
+                          temperature: Optional[float] = None,
+                          semantic_key: Optional[Tuple[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Send a prompt to the selected AI provider and stream the response.
+        
+        Args:
+            prompt (str): The user's input prompt
+            provider (str, optional): AI provider to use ('openai' or 'ollama')
+            model (str, optional): Model to use
+            temperature (float, optional): Response creativity (0-1)
+            semantic_key (tuple, optional): (kind, text) pair enabling the semantic cache
+            
+        Yields:
+            Dict[str, Any]: AI response holding the content received so far;
+                the last item has "done" set to True
+        """
+        provider, model, temp = self._resolve_request(provider, model, temperature)
+        cache_key, cached, semantic = self._lookup_cache(prompt, provider, model, temp, semantic_key)
+        if cached is not None:
+            cached["done"] = True
+            yield cached
+            return
+        
+        logger.info("Streaming prompt using %s with model %s", provider, model)
+        
+        content = ""
+        tokens_used = "N/A"  # Ollama doesn't provide token count
+        finished = False  # Set once the provider marks the response complete
+        try:
+            if provider == "openai" and self.openai_client:
+                # The context manager closes the HTTP stream if the consumer stops early
+                with self.openai_client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temp,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                ) as stream:
+                    for chunk in stream:
+                        if chunk.usage is not None:
+                            tokens_used = chunk.usage.total_tokens
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        if choice.finish_reason is not None:
+                            finished = True
+                        if choice.delta.content:
+                            content += choice.delta.content
+                            yield {"success": True, "content": content, "tokens_used": tokens_used, "done": False}
+            elif provider == "ollama":
+                logger.debug("Streaming request to Ollama with model %s", model)
+                with self._session.post(
+                    f"{self._next_ollama_endpoint()}/api/generate",
+                    data=orjson.dumps({
+                        "model": model,
+                        "prompt": prompt,
+                        "temperature": temp,
+                        "stream": True
+                    }),
+                    headers=_JSON_HEADERS,
+                    stream=True,
+                    timeout=HTTP_TIMEOUT
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        data = orjson.loads(line)
+                        if "error" in data:
+                            raise RuntimeError(data["error"])
+                        content += data.get("response", "")
+                        yield {"success": True, "content": content, "tokens_used": tokens_used, "done": False}
+                        if data.get("done"):
+                            finished = True
+                            break
+            else:
+                raise ValueError(f"Invalid or unavailable provider: {provider}")
+            
+            # A stream cut off early must not be reported or cached as a full answer
+            if not finished:
+                raise RuntimeError("Response stream ended before completion")
+            
+            logger.debug("Finished streaming response from %s", provider)
+            result = {"success": True, "content": content, "tokens_used": tokens_used}
+            self._store_cache(cache_key, semantic, result)
+            yield dict(result, done=True)
+            
+        except TIMEOUT_ERRORS as e:
+            logger.error("Timed out streaming prompt to %s: %s", provider, e)
+            yield {
+                "success": False,
+                "error": "timeout",
+                "done": True
+            }
+        except Exception as e:
+            if _is_read_timeout(e):
+                logger.error("Timed out streaming prompt to %s: %s", provider, e)
+                yield {
+                    "success": False,
+                    "error": "timeout",
+                    "done": True
+                }
+                return
+            logger.error("Error streaming prompt to %s: %s", provider, e)
+            yield {
+                "success": False,
+                "error": str(e),
+                "done": True
+            }
+
+    def _get_async_clients(self) -> Tuple[Optional[AsyncOpenAI], httpx.AsyncClient, asyncio.Semaphore]:
+        """Return async clients bound to the running event loop, creating them if needed."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # Pooled connections cannot be shared across event loops
+            self._async_loop = loop
+            self._async_openai = (
+                AsyncOpenAI(
+                    api_key=self._openai_api_key,
+                    http_client=DefaultAsyncHttpxClient(http2=True),
+                    timeout=HTTPX_TIMEOUT
+                )
+                if self.openai_client else None
+            )
+            self._httpx = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=16),
+                timeout=HTTPX_TIMEOUT
+            )
+            self._async_semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+        return self._async_openai, self._httpx, self._async_semaphore
+
+    async def aclose_async_clients(self) -> None:
+        """Close the async clients; await this on the loop that created them, before it ends."""
+        async_openai, ollama_client = self._async_openai, self._httpx
+        self._async_loop = None
+        self._async_openai = None
+        self._httpx = None
+        self._async_semaphore = None
+        if async_openai is not None:
+            await async_openai.close()
+        if ollama_client is not None:
+            await ollama_client.aclose()
+
+    async def send_prompt_async(self, 
+                               prompt: str, 
+                               provider: Optional[str] = None,
+                               model: Optional[str] = None,
+                               temperature: Optional[float] = None,
+                               semantic_key: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
+        """
+        Asynchronous version of send_prompt, safe to run concurrently.
+        
+        Args:
+            prompt (str): The user's input prompt
+            provider (str, optional): AI provider to use ('openai' or 'ollama')
+            model (str, optional): Model to use
+            temperature (float, optional): Response creativity (0-1)
+            semantic_key (tuple, optional): (kind, text) pair enabling the semantic cache
+            
+        Returns:
+            Dict[str, Any]: AI response
+        """
+        provider, model, temp = self._resolve_request(provider, model, temperature)
+        # Embedding and cache locks are blocking work, so keep them off the event loop
+        cache_key, cached, semantic = await asyncio.to_thread(
+            self._lookup_cache, prompt, provider, model, temp, semantic_key
+        )
+        if cached is not None:
+            return cached
+        
+        async_openai, ollama_client, semaphore = self._get_async_clients()
+        logger.info("Sending async prompt using %s with model %s", provider, model)
+        
+        try:
+            async with semaphore:
+                if provider == "openai" and async_openai:
+                    response = await async_openai.chat.completions.create(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=temp
+                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("OpenAI API response received for model %s", model)
+                    result = {
+                        "success": True,
+                        "content": response.choices[0].message.content,
+                        "tokens_used": response.usage.total_tokens
+                    }
+                elif provider == "ollama":
+                    logger.debug("Sending async request to Ollama with model %s", model)
+                    response = await ollama_client.post(
+                        f"{self._next_ollama_endpoint()}/api/generate",
+                        content=orjson.dumps({
+                            "model": model,
+                            "prompt": prompt,
+                            "temperature": temp,
+                            "stream": False
+                        }),
+                        headers=_JSON_HEADERS
+                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Ollama API response received for model %s", model)
+                    response.raise_for_status()
+                    result = {
+                        "success": True,
+                        "content": orjson.loads(response.content).get("response", ""),
+                        "tokens_used": "N/A"  # Ollama doesn't provide token count
+                    }
+                else:
+                    raise ValueError(f"Invalid or unavailable provider: {provider}")
+            
+            logger.debug("Successfully got async response from %s", provider)
+            await asyncio.to_thread(self._store_cache, cache_key, semantic, result)
+            return result
+            
+        except TIMEOUT_ERRORS as e:
+            logger.error("Timed out sending async prompt to %s: %s", provider, e)
+            return {
+                "success": False,
+                "error": "timeout"
+            }
+        except Exception as e:
+            logger.error("Error sending async prompt to %s: %s", provider, e)
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    @staticmethod
+    def _brainstorm_prompt(topic: str) -> str:
+        """Build the project brainstorming prompt for a topic."""
+        return _BRAINSTORM_TPL.substitute(topic=topic)
+
+    @staticmethod
+    def _code_prompt(description: str) -> str:
+        """Build the code suggestion prompt for a description."""
+        return _CODE_TPL.substitute(description=description)
+    
+    def is_brainstorm_cached(self, topic: str) -> bool:
+        """Whether brainstorm_project(topic) would be served from the exact-match cache."""
+        provider, model, temp = self._resolve_request(None, None, None)
+        key = self._cache_key(provider, model, temp, self._brainstorm_prompt(topic))
+        return self._cache_get(key) is not None
+    
     def brainstorm_project(self, topic: str) -> Dict[str, Any]:
         """
         Generate AI project ideas based on a topic.
@@ -164,16 +971,43 @@ class AIProjectAssistant:
         Returns:
             Dict[str, Any]: Project suggestions and implementation details
         """
-        prompt = f"""
-        Help me brainstorm an AI/Data Science project related to {topic}. Please provide:
-        1. Project title
-        2. Problem statement
-        3. Suggested approach
-        4. Required technologies/libraries
-        5. Potential challenges
-        6. Expected outcomes
+        return self.send_prompt(self._brainstorm_prompt(topic), semantic_key=("brainstorm", topic))
+    
+    def brainstorm_project_stream(self, topic: str) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming version of brainstorm_project.
+        
+        Args:
+            topic (str): The topic or field of interest
+            
+        Yields:
+            Dict[str, Any]: Project suggestions received so far
+        """
+        return self.send_prompt_stream(self._brainstorm_prompt(topic), semantic_key=("brainstorm", topic))
+    
+    async def brainstorm_project_async(self, topic: str) -> Dict[str, Any]:
+        """
+        Asynchronous version of brainstorm_project.
+        
+        Args:
+            topic (str): The topic or field of interest
+            
+        Returns:
+            Dict[str, Any]: Project suggestions and implementation details
+        """
+        return await self.send_prompt_async(self._brainstorm_prompt(topic), semantic_key=("brainstorm", topic))
+    
+    async def brainstorm_many(self, topics: List[str]) -> List[Dict[str, Any]]:
+        """
+        Brainstorm several topics concurrently.
+        
+        Args:
+            topics (list): Topics or fields of interest
+            
+        Returns:
+            List[Dict[str, Any]]: One response per topic, in the same order
         """
-        return self.send_prompt(prompt)
+        return await asyncio.gather(*[self.brainstorm_project_async(topic) for topic in topics])
     
     def get_code_suggestion(self, description: str) -> Dict[str, Any]:
         """
@@ -185,14 +1019,16 @@ class AIProjectAssistant:
         Returns:
             Dict[str, Any]: Code suggestions and explanations
         """
-        prompt = f"""
-        Please provide Python code suggestions for the following functionality:
-        {description}
+        return self.send_prompt(self._code_prompt(description), semantic_key=("code", description))
+    
+    def get_code_suggestion_stream(self, description: str) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming version of get_code_suggestion.
         
-        Include:
-        1. Code implementation
-        2. Required imports
-        3. Brief explanation of the approach
-        4. Any potential improvements
+        Args:
+            description (str): Description of the desired functionality
+            
+        Yields:
+            Dict[str, Any]: Code suggestions received so far
         """
-        return self.send_prompt(prompt)
+        return self.send_prompt_stream(self._code_prompt(description), semantic_key=("code", description))
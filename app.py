@@ -10,23 +10,25 @@ Improvements:
 - Enhanced error handling and model switching
 """
 
+import asyncio
+import functools
 import gradio as gr
 from ai_wrapper import AIProjectAssistant
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Iterator, Mapping, Sequence
 import os
 import logging
 from dotenv import load_dotenv
-from pathlib import Path
+from logging_setup import LOG_DIR, configure_logging
+
+# Use uvloop's faster event loop where available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # Set up logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-logging.basicConfig(
-    filename=log_dir / "app.log",
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filemode='a'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Load environment variables
@@ -49,6 +51,12 @@ PROJECT_OPTIONS = {
     "Virtual Avatar Creator": "Create an AI system that generates and animates virtual avatars"
 }
 
+# Persisted responses for the project options (see warm_cache)
+WARM_CACHE_FILE = LOG_DIR / "warm_cache.json"
+
+# Semantic cache persisted across restarts
+SEMANTIC_CACHE_DIR = LOG_DIR / "semantic_cache"
+
 # Custom CSS for better styling
 CUSTOM_CSS = """
 .container {
@@ -93,72 +101,146 @@ CUSTOM_CSS = """
 }
 """
 
-def get_model_choices() -> Dict[str, list]:
+# Static HTML fragments, built once at import
+_TITLE_HTML = """
+<div class="title">
+    <h1>🤖 DDS AI Project Assistant 🚀</h1>
+    <p class="subtitle">Your Generative AI Project Development Companion</p>
+</div>
+"""
+
+_SIDEBAR_HEADER_HTML = """
+<h3 style="text-align: center; color: #61dafb;">
+    🎯 Popular GenAI Projects
+</h3>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; margin-top: 20px; padding: 10px; border-top: 2px solid #61dafb;">
+    <p>Original Project by DDS Team | Enhanced by Dennis Daniels | Powered by OpenAI & Ollama</p>
+</div>
+"""
+
+_PROJECT_KEYS = tuple(PROJECT_OPTIONS)
+
+async def _brainstorm_options(descriptions: list) -> list:
+    """Brainstorm descriptions concurrently, closing the async clients before the loop ends."""
+    try:
+        return await assistant.brainstorm_many(descriptions)
+    finally:
+        await assistant.aclose_async_clients()
+
+def warm_cache() -> None:
+    """Preload responses for all project options when WARMUP_CACHE=1."""
+    if os.getenv("WARMUP_CACHE") != "1":
+        return
+    
+    if WARM_CACHE_FILE.exists():
+        try:
+            assistant.load_cache(WARM_CACHE_FILE)
+        except (OSError, ValueError, TypeError) as e:
+            # Corrupt or partially written file; regenerate it below
+            logger.error("Ignoring unreadable warm cache %s: %s", WARM_CACHE_FILE, e)
+    
+    # Only options missing from the cache, e.g. earlier failures or another provider/model
+    missing = [description for description in PROJECT_OPTIONS.values()
+               if not assistant.is_brainstorm_cached(description)]
+    if not missing:
+        return
+    
+    logger.info("Warming response cache for %d project options", len(missing))
+    responses = asyncio.run(_brainstorm_options(missing))
+    succeeded = sum(1 for response in responses if response["success"])
+    logger.info("Warmed %d/%d project options", succeeded, len(responses))
+    if succeeded:
+        assistant.save_cache(WARM_CACHE_FILE)
+
+def format_error(response: Dict[str, Any]) -> str:
+    """Build a user-facing error message from a failed AI response."""
+    error = response.get('error', 'Unknown error occurred')
+    if error == "timeout":
+        return "Error: The AI provider timed out. Check that it is running and try again."
+    return f"Error: {error}"
+
+def get_model_choices() -> Mapping[str, Sequence[str]]:
     """Get available models from both providers."""
     logger.debug("Fetching available models")
     return assistant.get_available_models()
 
 def update_model_choices(provider: str) -> Dict:
     """Update model choices based on selected provider."""
-    logger.debug(f"Updating model choices for provider: {provider}")
+    logger.debug("Updating model choices for provider: %s", provider)
     models = get_model_choices()
     
     # Set appropriate default model based on provider
     default_model = "gpt-4" if provider == "openai" else "llama3.2"
     
     return gr.Dropdown(
-        choices=models.get(provider, []),
+        choices=list(models.get(provider, ())),
         value=default_model
     )
 
-def process_input(input_type: str, query: str, provider: str, model: str) -> Tuple[str, str]:
-    """Process user input and return AI response."""
+def refresh_model_choices(provider: str) -> Dict:
+    """Re-query the providers and update model choices."""
+    logger.debug("Refreshing available models")
+    assistant.invalidate_models_cache()
+    return update_model_choices(provider)
+
+def process_input_stream(input_type: str, query: str, provider: str, model: str) -> Iterator[Tuple[str, str]]:
+    """Process user input and stream the AI response as it is generated."""
     if not query.strip():
         logger.warning("Empty query received")
-        return "", "Please enter a query"
+        yield "", "Please enter a query"
+        return
     
-    logger.info(f"Processing {input_type} request with {provider} using {model}")
+    logger.info("Streaming %s request with %s using %s", input_type, provider, model)
     
     if input_type == "brainstorm":
-        response = assistant.brainstorm_project(query)
+        responses = assistant.brainstorm_project_stream(query)
     else:
-        response = assistant.get_code_suggestion(query)
+        responses = assistant.get_code_suggestion_stream(query)
     
-    if response["success"]:
-        status = f"Success! Tokens used: {response.get('tokens_used', 'N/A')}"
-        logger.info(f"Request successful: {status}")
-        return response["content"], status
-    else:
-        error_msg = f"Error: {response.get('error', 'Unknown error occurred')}"
-        logger.error(error_msg)
-        return "", error_msg
+    for response in responses:
+        if not response["success"]:
+            error_msg = format_error(response)
+            logger.error(error_msg)
+            yield "", error_msg
+            return
+        
+        if response["done"]:
+            status = f"Success! Tokens used: {response.get('tokens_used', 'N/A')}"
+            logger.info("Request successful: %s", status)
+        else:
+            status = "Generating..."
+        yield response["content"], status
 
-def handle_project_click(project_name: str, provider: str, model: str) -> Tuple[str, str, str]:
-    """Handle when a project option is clicked."""
-    description = PROJECT_OPTIONS[project_name]
-    response = assistant.brainstorm_project(description)
+async def handle_project_click(project_name: str, description: str, provider: str, model: str) -> Tuple[str, str, str]:
+    """Handle when a project option is clicked; name and description are bound per button."""
+    logger.debug("Project option clicked: %s", project_name)
+    response = await assistant.brainstorm_project_async(description)
     
     if response["success"]:
         status = f"Success! Tokens used: {response.get('tokens_used', 'N/A')}"
-        logger.info(f"Project click handled successfully: {status}")
+        logger.info("Project click handled successfully: %s", status)
         return "brainstorm", description, response["content"]
     else:
-        error_msg = f"Error: {response.get('error', 'Unknown error occurred')}"
-        logger.error(f"Error handling project click: {error_msg}")
+        error_msg = format_error(response)
+        logger.error("Error handling project click: %s", error_msg)
         return "brainstorm", description, error_msg
 
 if __name__ == "__main__":
     logger.info("Starting application")
+    warm_cache()
+    try:
+        assistant.load_semantic_cache(SEMANTIC_CACHE_DIR)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        # Corrupt or partially written cache; start empty and overwrite it on exit
+        logger.error("Ignoring unreadable semantic cache %s: %s", SEMANTIC_CACHE_DIR, e)
     
     # Create Gradio interface with custom theme and tabs
     with gr.Blocks(css=CUSTOM_CSS, title="DDS AI Project Assistant") as interface:
         with gr.Column(elem_classes="container"):
-            gr.HTML("""
-                <div class="title">
-                    <h1>🤖 DDS AI Project Assistant 🚀</h1>
-                    <p class="subtitle">Your Generative AI Project Development Companion</p>
-                </div>
-            """)
+            gr.HTML(_TITLE_HTML)
             
             # Create tabs for main interface and API configuration
             with gr.Tabs():
@@ -167,16 +249,12 @@ if __name__ == "__main__":
                     with gr.Row():
                         # Left sidebar with project options
                         with gr.Column(scale=1, elem_classes="sidebar"):
-                            gr.HTML("""
-                                <h3 style="text-align: center; color: #61dafb;">
-                                    🎯 Popular GenAI Projects
-                                </h3>
-                            """)
+                            gr.HTML(_SIDEBAR_HEADER_HTML)
                             project_buttons = [
                                 gr.Button(
                                     name,
                                     elem_classes="project-button"
-                                ) for name in PROJECT_OPTIONS.keys()
+                                ) for name in _PROJECT_KEYS
                             ]
                         
                         # Main content area
@@ -188,9 +266,13 @@ if __name__ == "__main__":
                                     value=assistant.current_provider
                                 )
                                 model = gr.Dropdown(
-                                    choices=get_model_choices().get(assistant.current_provider, []),
+                                    choices=list(get_model_choices().get(assistant.current_provider, ())),
                                     label="🔧 Model",
-                                    value=assistant.default_model.split(":")[0] if assistant.current_provider == "ollama" else assistant.default_model
+                                    value=assistant.default_model.partition(":")[0] if assistant.current_provider == "ollama" else assistant.default_model
+                                )
+                                refresh_btn = gr.Button(
+                                    "🔄 Refresh Models",
+                                    elem_classes="project-button"
                                 )
                             
                             input_type = gr.Radio(
@@ -221,24 +303,20 @@ if __name__ == "__main__":
                     
                             # Handle main submit button
                             submit_btn.click(
-                                fn=process_input,
+                                fn=process_input_stream,
                                 inputs=[input_type, query, provider, model],
                                 outputs=[output, status]
                             )
                             
                             # Handle project option buttons
-                            for btn in project_buttons:
+                            for name, btn in zip(_PROJECT_KEYS, project_buttons):
                                 btn.click(
-                                    fn=handle_project_click,
-                                    inputs=[btn, provider, model],
+                                    fn=functools.partial(handle_project_click, name, PROJECT_OPTIONS[name]),
+                                    inputs=[provider, model],
                                     outputs=[input_type, query, output]
                                 )
                     
-                    gr.HTML("""
-                    <div style="text-align: center; margin-top: 20px; padding: 10px; border-top: 2px solid #61dafb;">
-                        <p>Original Project by DDS Team | Enhanced by Dennis Daniels | Powered by OpenAI & Ollama</p>
-                    </div>
-                    """)
+                    gr.HTML(_FOOTER_HTML)
                 
                 # API Configuration tab
                 with gr.Tab("API Configuration"):
@@ -267,7 +345,7 @@ if __name__ == "__main__":
                                 value="Checking...",
                                 interactive=False
                             )
-                            if "ollama" in get_model_choices():
+                            if assistant.ollama_available:
                                 ollama_status.value = "✅ Connected"
                             else:
                                 ollama_status.value = "❌ Not Connected (Install Ollama locally)"
@@ -284,5 +362,15 @@ if __name__ == "__main__":
                 inputs=[provider],
                 outputs=[model]
             )
+            
+            # Re-query available models on demand
+            refresh_btn.click(
+                fn=refresh_model_choices,
+                inputs=[provider],
+                outputs=[model]
+            )
     
-    interface.launch()
+    try:
+        interface.launch()
+    finally:
+        assistant.save_semantic_cache(SEMANTIC_CACHE_DIR)
@@ -0,0 +1,42 @@
+"""
+AI Project Generator - Logging Setup
+Original Project: DDS AI Project Assistant
+Enhanced by: Dennis Daniels
+
+Configures application logging once for all modules. Records are handed
+to a queue and written to logs/app.log by a background listener thread,
+keeping file I/O off the request path.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Optional
+
+LOG_DIR = Path("logs")
+LOG_FILE = LOG_DIR / "app.log"
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def configure_logging(level: int = logging.DEBUG) -> None:
+    """Attach a queue handler to the root logger; later calls are no-ops."""
+    global _listener
+    if _listener is not None:
+        return
+    
+    LOG_DIR.mkdir(exist_ok=True)
+    file_handler = logging.FileHandler(LOG_FILE, mode='a')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush queued records before the interpreter exits
+    atexit.register(_listener.stop)